@@ -9,11 +9,13 @@ class DepartmentAdmin(admin.ModelAdmin):
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
     list_display = ('code', 'name', 'department', 'semester')
+    list_select_related = ('department',)
     list_filter = ('department', 'semester')
     search_fields = ('name', 'code')
 
 @admin.register(CourseEnrollment)
 class CourseEnrollmentAdmin(admin.ModelAdmin):
     list_display = ('student', 'course', 'section', 'enrolled_at')
+    list_select_related = ('student', 'course')
     list_filter = ('course', 'section')
     search_fields = ('student__username', 'course__code')
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -98,6 +99,22 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The exam question and active-exam caches are invalidated by signals, which only
+# reach the backend they run against. LocMemCache is per process, so on it question
+# payloads are only kept for 30 seconds; set CACHE_BACKEND to a shared backend, e.g.
+# django.core.cache.backends.redis.RedisCache with CACHE_LOCATION=redis://..., to
+# cache them until they change.
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -116,6 +133,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# PBKDF2 dominates test setup time; tests don't need strong hashes
+TESTING = 'test' in sys.argv
+if TESTING:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -1,9 +1,13 @@
 from django.shortcuts import redirect, render
 
+# Built once at import; index() runs on every root URL hit
+ROLE_REDIRECTS = {
+    'TEACHER': 'teacher_dashboard',
+    'ADMIN': 'teacher_dashboard',
+    'STUDENT': 'student_dashboard',
+}
+
 def index(request):
-    if request.user.is_authenticated:
-        if request.user.role == 'TEACHER' or request.user.role == 'ADMIN':
-            return redirect('teacher_dashboard')
-        elif request.user.role == 'STUDENT':
-            return redirect('student_dashboard')
-    return redirect('/admin/login/')
+    if not request.user.is_authenticated:
+        return redirect('/admin/login/')
+    return redirect(ROLE_REDIRECTS.get(request.user.role, '/admin/login/'))
@@ -8,30 +8,42 @@ class QuestionOptionInline(admin.TabularInline):
 @admin.register(Question)
 class QuestionAdmin(admin.ModelAdmin):
     list_display = ('text_preview', 'course', 'question_type', 'difficulty', 'marks', 'is_active')
+    list_select_related = ('course',)
     list_filter = ('course', 'question_type', 'difficulty', 'is_active')
     search_fields = ('text',)
     inlines = [QuestionOptionInline]
 
-    def text_preview(self, obj):
-        return obj.text[:50] + "..." if len(obj.text) > 50 else obj.text
+    def get_queryset(self, request):
+        # The changelist only shows text_preview, so skip the full text column
+        return super().get_queryset(request).defer('text')
 
 class ExamQuestionInline(admin.TabularInline):
     model = ExamQuestion
     extra = 1
+    autocomplete_fields = ('question',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('question')
 
 @admin.register(Exam)
 class ExamAdmin(admin.ModelAdmin):
     list_display = ('name', 'course', 'start_datetime', 'duration_minutes', 'status')
+    list_select_related = ('course',)
     list_filter = ('course', 'status')
+    search_fields = ('name',)
     inlines = [ExamQuestionInline]
 
 @admin.register(ExamStudent)
 class ExamStudentAdmin(admin.ModelAdmin):
     list_display = ('student', 'exam', 'status', 'total_score', 'started_at', 'submitted_at')
+    list_select_related = ('student', 'exam')
     list_filter = ('status', 'exam')
     search_fields = ('student__username', 'exam__name')
+    autocomplete_fields = ('student', 'exam')
 
 @admin.register(StudentAnswer)
 class StudentAnswerAdmin(admin.ModelAdmin):
     list_display = ('exam_student', 'question', 'is_evaluated', 'marks_awarded')
+    list_select_related = ('exam_student__student', 'exam_student__exam', 'question')
     list_filter = ('is_evaluated',)
+    autocomplete_fields = ('exam_student', 'question')
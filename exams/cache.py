@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Invalidation runs on commit: deleting inside the writer's transaction would let a
+# concurrent reader re-cache the old rows before the change becomes visible.
+
+# A per-process cache never sees invalidations from other workers, so there the
+# timeout is the only bound on how long an edited question can be served stale
+SHARED_CACHE = settings.CACHES['default']['BACKEND'] != 'django.core.cache.backends.locmem.LocMemCache'
+
+# Serialized question sets only change when a teacher edits the exam
+EXAM_QUESTIONS_TIMEOUT = 60 * 60 if SHARED_CACHE else 30
+
+def exam_questions_key(exam_id):
+    return f'exam:{exam_id}:questions'
+
+def invalidate_exam_questions(exam_ids):
+    keys = [exam_questions_key(exam_id) for exam_id in exam_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+# Every student polls the same active-exam list; exam saves invalidate it
+ACTIVE_EXAMS_KEY = 'exams:active'
+ACTIVE_EXAMS_TIMEOUT = 30
+
+def invalidate_active_exams():
+    transaction.on_commit(lambda: cache.delete(ACTIVE_EXAMS_KEY))
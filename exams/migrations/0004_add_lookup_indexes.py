@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-15 01:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_initial'),
+        ('exams', '0003_add_question_order_to_examstudent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='examstudent',
+            index=models.Index(fields=['exam', 'status'], name='examstudent_exam_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['course', 'is_active'], name='exams_quest_course__47e9bf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentanswer',
+            index=models.Index(fields=['exam_student', 'is_evaluated'], name='exams_stude_exam_st_e94ab0_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-15 01:56
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0004_add_lookup_indexes'),
+    ]
+
+    # jsonb has no cast to bigint[], so copy the data through a new column
+    operations = [
+        migrations.AddField(
+            model_name='studentanswer',
+            name='selected_options_array',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, size=None),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE exams_studentanswer
+                SET selected_options_array = ARRAY(
+                    SELECT jsonb_array_elements_text(selected_options)::bigint
+                )
+                WHERE jsonb_typeof(selected_options) = 'array';
+            """,
+            reverse_sql="""
+                UPDATE exams_studentanswer
+                SET selected_options = to_jsonb(selected_options_array);
+            """,
+        ),
+        migrations.RemoveField(
+            model_name='studentanswer',
+            name='selected_options',
+        ),
+        migrations.RenameField(
+            model_name='studentanswer',
+            old_name='selected_options_array',
+            new_name='selected_options',
+        ),
+    ]
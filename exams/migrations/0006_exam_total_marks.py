@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-15 01:59
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_total_marks(apps, schema_editor):
+    Exam = apps.get_model('exams', 'Exam')
+    ExamQuestion = apps.get_model('exams', 'ExamQuestion')
+    totals = ExamQuestion.objects.filter(exam=OuterRef('pk')).values('exam').annotate(
+        total=Sum(Coalesce('marks_override', 'question__marks'))
+    ).values('total')
+    Exam.objects.update(total_marks=Coalesce(Subquery(totals), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0005_selected_options_array'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='total_marks',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_total_marks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 02:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0006_exam_total_marks'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='examquestion',
+            index=models.Index(fields=['exam', 'order'], name='exams_examq_exam_id_b093bd_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-15 02:08
+
+from django.db import migrations, models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Concat, Length, Substr
+from django.db.models.lookups import GreaterThan
+
+
+def backfill_text_preview(apps, schema_editor):
+    Question = apps.get_model('exams', 'Question')
+    Question.objects.update(text_preview=Case(
+        When(
+            GreaterThan(Length('text'), 50),
+            then=Concat(Substr('text', 1, 50), Value('...'), output_field=models.CharField()),
+        ),
+        default=F('text'),
+        output_field=models.CharField(),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0007_examquestion_order_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='text_preview',
+            field=models.CharField(blank=True, editable=False, max_length=60),
+        ),
+        migrations.RunPython(backfill_text_preview, migrations.RunPython.noop),
+    ]
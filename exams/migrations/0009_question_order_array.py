@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-15 02:10
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0008_question_text_preview'),
+    ]
+
+    # jsonb has no cast to bigint[], so copy the data through a new column
+    operations = [
+        migrations.AddField(
+            model_name='examstudent',
+            name='question_order_array',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, size=None),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE exams_examstudent
+                SET question_order_array = ARRAY(
+                    SELECT jsonb_array_elements_text(question_order)::bigint
+                )
+                WHERE jsonb_typeof(question_order) = 'array';
+            """,
+            reverse_sql="""
+                UPDATE exams_examstudent
+                SET question_order = to_jsonb(question_order_array);
+            """,
+        ),
+        migrations.RemoveField(
+            model_name='examstudent',
+            name='question_order',
+        ),
+        migrations.RenameField(
+            model_name='examstudent',
+            old_name='question_order_array',
+            new_name='question_order',
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-15 02:24
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count
+
+
+def check_duplicate_attempts(apps, schema_editor):
+    # Duplicate attempts carry their own answers and scores, so picking one to
+    # keep is left to an admin rather than done silently here
+    ExamStudent = apps.get_model('exams', 'ExamStudent')
+    duplicates = list(
+        ExamStudent.objects.values('exam_id', 'student_id')
+        .annotate(attempts=Count('id'))
+        .filter(attempts__gt=1)
+        .order_by('exam_id', 'student_id')
+    )
+    if duplicates:
+        pairs = ', '.join(
+            f"exam={d['exam_id']} student={d['student_id']} ({d['attempts']} attempts)"
+            for d in duplicates[:20]
+        )
+        more = f" and {len(duplicates) - 20} more" if len(duplicates) > 20 else ""
+        raise RuntimeError(
+            "Cannot add the one-attempt-per-student constraint: found duplicate "
+            f"ExamStudent rows for {pairs}{more}. Delete or merge the extra "
+            "attempts, then run migrate again."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0009_question_order_array'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_attempts, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='examstudent',
+            unique_together={('exam', 'student')},
+        ),
+    ]
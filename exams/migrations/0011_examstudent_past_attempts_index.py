@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-15 02:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0010_examstudent_unique_attempt'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='examstudent',
+            index=models.Index(fields=['student', 'status', '-submitted_at'], name='examstudent_past_attempts_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-15 02:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_initial'),
+        ('exams', '0011_examstudent_past_attempts_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['course', 'question_type'], name='exams_quest_course__8b2829_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from academics.models import Course
 
 class Question(models.Model):
@@ -24,9 +25,28 @@ class Question(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Denormalized from text so repr/admin paths don't load the full TextField
+    text_preview = models.CharField(max_length=60, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['course', 'is_active']),
+            models.Index(fields=['course', 'question_type']), # Question bank filtered by type
+        ]
+
+    @staticmethod
+    def make_preview(text):
+        return text[:50] + "..." if len(text) > 50 else text
+
+    def save(self, *args, **kwargs):
+        self.text_preview = self.make_preview(self.text)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'text' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'text_preview'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.text[:50]}..."
+        return self.text_preview
 
 class QuestionOption(models.Model):
     question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name='options')
@@ -58,6 +78,9 @@ class Exam(models.Model):
     
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.DRAFT)
     
+    # Kept in sync by exams.signals whenever the question set changes
+    total_marks = models.PositiveIntegerField(default=0)
+    
     questions = models.ManyToManyField(Question, through='ExamQuestion')
 
     def __str__(self):
@@ -71,6 +94,9 @@ class ExamQuestion(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['exam', 'order']),
+        ]
 
 class ExamStudent(models.Model):
     class Status(models.TextChoices):
@@ -91,12 +117,19 @@ class ExamStudent(models.Model):
     submitted_at = models.DateTimeField(null=True, blank=True)
     
     # Store shuffled question order (list of question IDs)
-    question_order = models.JSONField(default=list, blank=True)
+    question_order = ArrayField(models.BigIntegerField(), default=list, blank=True)
     
     # Security logs
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True)
 
+    class Meta:
+        unique_together = ('exam', 'student') # One attempt per student; also serves (exam, student) lookups
+        indexes = [
+            models.Index(fields=['exam', 'status'], name='examstudent_exam_status_idx'), # Live status counters
+            models.Index(fields=['student', 'status', '-submitted_at'], name='examstudent_past_attempts_idx'), # Student dashboard, newest first
+        ]
+
     def __str__(self):
         return f"{self.student} - {self.exam}"
 
@@ -104,8 +137,8 @@ class StudentAnswer(models.Model):
     exam_student = models.ForeignKey(ExamStudent, on_delete=models.CASCADE, related_name='answers')
     question = models.ForeignKey(Question, on_delete=models.CASCADE)
     
-    # For MCQ/MSQ - store list of option IDs as JSON or comma-separated
-    selected_options = models.JSONField(default=list, blank=True) 
+    # For MCQ/MSQ - list of selected option IDs
+    selected_options = ArrayField(models.BigIntegerField(), default=list, blank=True)
     
     # For Subjective
     answer_text = models.TextField(blank=True)
@@ -115,3 +148,6 @@ class StudentAnswer(models.Model):
 
     class Meta:
         unique_together = ('exam_student', 'question')
+        indexes = [
+            models.Index(fields=['exam_student', 'is_evaluated']),
+        ]
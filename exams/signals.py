@@ -0,0 +1,51 @@
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from .cache import invalidate_active_exams, invalidate_exam_questions
+from .models import Exam, ExamQuestion, Question, QuestionOption
+
+def _exam_ids_for_question(question_id):
+    return list(ExamQuestion.objects.filter(question_id=question_id).values_list('exam_id', flat=True))
+
+def refresh_total_marks(exam_ids):
+    totals = ExamQuestion.objects.filter(exam=OuterRef('pk')).values('exam').annotate(
+        total=Sum(Coalesce('marks_override', 'question__marks'))
+    ).values('total')
+    Exam.objects.filter(pk__in=exam_ids).update(total_marks=Coalesce(Subquery(totals), 0))
+
+def _question_set_changed(exam_ids):
+    if exam_ids:
+        invalidate_exam_questions(exam_ids)
+        refresh_total_marks(exam_ids)
+
+@receiver(m2m_changed, sender=Exam.questions.through)
+def exam_questions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        # The links are gone after the clear, so remember which exams to refresh
+        instance._cleared_exam_ids = _exam_ids_for_question(instance.pk)
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        _question_set_changed([instance.pk])
+    elif action == 'post_clear':
+        _question_set_changed(instance._cleared_exam_ids)
+    else:
+        _question_set_changed(list(pk_set))
+
+@receiver([post_save, post_delete], sender=ExamQuestion)
+def exam_question_changed(sender, instance, **kwargs):
+    _question_set_changed([instance.exam_id])
+
+@receiver(post_save, sender=Question)
+def question_changed(sender, instance, **kwargs):
+    _question_set_changed(_exam_ids_for_question(instance.pk))
+
+@receiver([post_save, post_delete], sender=QuestionOption)
+def question_option_changed(sender, instance, **kwargs):
+    invalidate_exam_questions(_exam_ids_for_question(instance.question_id))
+
+@receiver([post_save, post_delete], sender=Exam)
+def exam_changed(sender, instance, **kwargs):
+    invalidate_active_exams()
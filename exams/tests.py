@@ -1,24 +1,45 @@
 from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
-from django.db import models
+from django.db import connection, DatabaseError
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from datetime import timedelta
 import io
+from unittest import mock
 from academics.models import Department, Course, CourseEnrollment
 from users.models import StudentProfile
-from exams.models import Exam, Question, QuestionOption, ExamStudent, StudentAnswer
+from exams.models import Exam, Question, QuestionOption, ExamQuestion, ExamStudent, StudentAnswer
+from exams.cache import exam_questions_key
 
 User = get_user_model()
 
-class MVPPhase1Tests(TestCase):
-    def setUp(self):
+
+class QueryCountMixin:
+    def assertQueryCountFlat(self, request, grow):
+        """Assert request() runs as many queries after grow() as before; returns that count"""
+        def count():
+            with CaptureQueriesContext(connection) as ctx:
+                response = request()
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries)
+
+        baseline = count()
+        grow()
+        self.assertEqual(count(), baseline)
+        return baseline
+
+
+class MVPPhase1Tests(QueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
         # 1. Setup Users
-        self.admin = User.objects.create_superuser(username='admin', email='admin@test.com', password='password')
-        self.teacher = User.objects.create_user(username='teacher', email='teacher@test.com', password='password', role=User.Role.TEACHER)
+        cls.admin = User.objects.create_superuser(username='admin', email='admin@test.com', password='password')
+        cls.teacher = User.objects.create_user(username='teacher', email='teacher@test.com', password='password', role=User.Role.TEACHER)
         
         # Student with full details for UI tests
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             username='student', 
             email='student@test.com', 
             password='password', 
@@ -26,21 +47,23 @@ class MVPPhase1Tests(TestCase):
             first_name='John',
             last_name='Doe'
         )
-        self.student_profile = StudentProfile.objects.create(user=self.student, roll_no="STU001", batch="2024", section="A")
+        cls.student_profile = StudentProfile.objects.create(user=cls.student, roll_no="STU001", batch="2024", section="A")
 
-        self.student2 = User.objects.create_user(username='student2', email='student2@test.com', password='password', role=User.Role.STUDENT)
+        cls.student2 = User.objects.create_user(username='student2', email='student2@test.com', password='password', role=User.Role.STUDENT)
 
         # 2. Setup Academics
-        self.dept = Department.objects.create(name="CSE", code="CSE")
-        self.course = Course.objects.create(name="Python Basics", code="CS101", department=self.dept, semester=1)
+        cls.dept = Department.objects.create(name="CSE", code="CSE")
+        cls.course = Course.objects.create(name="Python Basics", code="CS101", department=cls.dept, semester=1)
         
         # Enroll student
-        CourseEnrollment.objects.create(student=self.student, course=self.course, section="A")
+        CourseEnrollment.objects.create(student=cls.student, course=cls.course, section="A")
 
         # 3. Setup Question Bank (MCQ)
-        self.q1 = Question.objects.create(course=self.course, text="What is 2+2?", marks=1, question_type=Question.Type.MCQ, created_by=self.teacher)
-        self.q1_opt_a = QuestionOption.objects.create(question=self.q1, text="3", is_correct=False)
-        self.q1_opt_b = QuestionOption.objects.create(question=self.q1, text="4", is_correct=True)
+        cls.q1 = Question.objects.create(course=cls.course, text="What is 2+2?", marks=1, question_type=Question.Type.MCQ, created_by=cls.teacher)
+        cls.q1_opt_a, cls.q1_opt_b = QuestionOption.objects.bulk_create([
+            QuestionOption(question=cls.q1, text="3", is_correct=False),
+            QuestionOption(question=cls.q1, text="4", is_correct=True),
+        ])
 
     # --- Feature: User roles & login ---
     def test_user_roles_and_login(self):
@@ -96,6 +119,23 @@ class MVPPhase1Tests(TestCase):
         self.assertEqual(exam.questions.count(), 1)
         self.assertEqual(exam.status, Exam.Status.SCHEDULED)
 
+    def test_teacher_dashboard_is_paginated(self):
+        """Teacher dashboard shows 25 exams per page"""
+        now = timezone.now()
+        Exam.objects.bulk_create([
+            Exam(name=f"Exam {i}", course=self.course, duration_minutes=60,
+                 start_datetime=now, end_datetime=now + timedelta(hours=1))
+            for i in range(30)
+        ])
+        self.client.login(username='teacher', password='password')
+
+        response = self.client.get(reverse('teacher_dashboard'))
+        self.assertEqual(len(response.context['page_obj']), 25)
+        self.assertContains(response, "Page 1 of 2")
+
+        response = self.client.get(reverse('teacher_dashboard'), {'page': 2})
+        self.assertEqual(len(response.context['page_obj']), 5)
+
     # --- Feature: Student exam UI (Backend Logic) ---
     def test_student_exam_ui_logic(self):
         """Test Timer, Autosave logic via API"""
@@ -167,6 +207,11 @@ class MVPPhase1Tests(TestCase):
         self.assertEqual(attempt.score_objective, 1.0)
         self.assertEqual(attempt.status, ExamStudent.Status.SUBMITTED)
 
+        # A second submit is rejected without re-grading
+        response = self.client.post(reverse('submit-exam', args=[attempt_id]))
+        self.assertEqual(response.json()['status'], 'already_submitted')
+        self.assertEqual(ExamStudent.objects.get(id=attempt_id).submitted_at, attempt.submitted_at)
+
         # Verify Teacher View (Simple results)
         self.client.logout()
         self.client.login(username='teacher', password='password')
@@ -177,37 +222,136 @@ class MVPPhase1Tests(TestCase):
         self.assertContains(response, "John Doe") # First/Last name
         self.assertContains(response, "1.0") # Score
 
-class ExamFlowTest(TestCase):
-    def setUp(self):
+    def _make_students(self, n, exam):
+        """Create n enrolled students with profiles and an attempt on exam"""
+        offset = User.objects.count()
+        students = User.objects.bulk_create([
+            User(username=f'bulk_student_{offset + i}', email=f'bulk_student_{offset + i}@test.com', role=User.Role.STUDENT)
+            for i in range(n)
+        ])
+        StudentProfile.objects.bulk_create([
+            StudentProfile(user=student, roll_no=f"BLK{offset + i:04d}", batch="2024", section="A")
+            for i, student in enumerate(students)
+        ])
+        CourseEnrollment.objects.bulk_create([
+            CourseEnrollment(student=student, course=exam.course) for student in students
+        ])
+        ExamStudent.objects.bulk_create([
+            ExamStudent(exam=exam, student=student, status=ExamStudent.Status.SUBMITTED)
+            for student in students
+        ])
+        return students
+
+    def test_live_status_queries_do_not_scale_with_students(self):
+        """Live status should load attempts, students and profiles in one query"""
+        exam = Exam.objects.create(
+            name="Monitored Exam", course=self.course, duration_minutes=60,
+            start_datetime=timezone.now(), end_datetime=timezone.now() + timedelta(hours=1),
+            status=Exam.Status.RUNNING
+        )
+        self.client.login(username='teacher', password='password')
+
+        self._make_students(1, exam)
+        baseline = self.assertQueryCountFlat(
+            lambda: self.client.get(reverse('exam_live_status', args=[exam.id])),
+            lambda: self._make_students(50, exam),
+        )
+        # Every counter comes from the same rows, so they agree with each other
+        response = self.client.get(reverse('exam_live_status', args=[exam.id]))
+        self.assertEqual(response.context['total_students'], 51)
+        self.assertEqual(response.context['submitted_count'], 51)
+        # session, user, exam+course, attempts (status counters are tallied from the rows)
+        self.assertEqual(baseline, 4)
+
+    def test_start_and_submit_query_counts(self):
+        """Start and submit run a fixed number of queries"""
+        exam = Exam.objects.create(
+            name="Counted Exam", course=self.course, duration_minutes=60,
+            start_datetime=timezone.now(), end_datetime=timezone.now() + timedelta(hours=1),
+            status=Exam.Status.RUNNING
+        )
+        exam.questions.add(self.q1)
+        self.client.login(username='student', password='password')
+
+        # session, user, exam, attempt lookup, questions, options,
+        # attempt insert + re-read, saved answers
+        with self.assertNumQueries(9):
+            attempt_id = self.client.post(reverse('start-exam', args=[exam.id])).json()['attempt_id']
+
+        # Resuming: session, user, exam, attempt, saved answers (questions are cached)
+        with self.assertNumQueries(5):
+            self.client.post(reverse('start-exam', args=[exam.id]))
+
+        self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': self.q1.id, 'selected_options': [self.q1_opt_b.id]
+        }, content_type='application/json')
+
+        # session, user, atomic (savepoint, claim update, attempt, answer key,
+        # answers, bulk_update, score update, release)
+        with self.assertNumQueries(10):
+            self.client.post(reverse('submit-exam', args=[attempt_id]))
+
+    def test_submit_rolls_back_claim_when_grading_fails(self):
+        """A grading failure leaves the attempt open so the submit can be retried"""
+        exam = Exam.objects.create(
+            name="Flaky Exam", course=self.course, duration_minutes=60,
+            start_datetime=timezone.now(), end_datetime=timezone.now() + timedelta(hours=1),
+            status=Exam.Status.RUNNING
+        )
+        exam.questions.add(self.q1)
+        self.client.login(username='student', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[exam.id])).json()['attempt_id']
+
+        with mock.patch('exams.views.auto_evaluate_attempt', side_effect=DatabaseError("grading failed")):
+            with self.assertRaises(DatabaseError):
+                self.client.post(reverse('submit-exam', args=[attempt_id]))
+        attempt = ExamStudent.objects.get(id=attempt_id)
+        self.assertEqual(attempt.status, ExamStudent.Status.IN_PROGRESS)
+        self.assertIsNone(attempt.submitted_at)
+
+        # The retry grades the attempt instead of reporting it already submitted
+        response = self.client.post(reverse('submit-exam', args=[attempt_id]))
+        self.assertEqual(response.json()['status'], 'submitted')
+
+class ExamFlowTest(QueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
         # 1. Setup Users
-        self.teacher = User.objects.create_user(username='teacher_flow', email='teacher_flow@test.com', password='password', role=User.Role.TEACHER)
-        self.student = User.objects.create_user(username='student_flow', email='student_flow@test.com', password='password', role=User.Role.STUDENT)
-        self.student_profile = StudentProfile.objects.create(user=self.student, roll_no="STU002", batch="2024", section="B")
+        cls.teacher = User.objects.create_user(username='teacher_flow', email='teacher_flow@test.com', password='password', role=User.Role.TEACHER)
+        cls.student = User.objects.create_user(username='student_flow', email='student_flow@test.com', password='password', role=User.Role.STUDENT)
+        cls.student_profile = StudentProfile.objects.create(user=cls.student, roll_no="STU002", batch="2024", section="B")
 
         # 2. Setup Academics
-        self.dept = Department.objects.create(name="ECE", code="ECE")
-        self.course = Course.objects.create(name="Digital Electronics", code="EC101", department=self.dept, semester=2)
-        CourseEnrollment.objects.create(student=self.student, course=self.course, section="B")
+        cls.dept = Department.objects.create(name="ECE", code="ECE")
+        cls.course = Course.objects.create(name="Digital Electronics", code="EC101", department=cls.dept, semester=2)
+        CourseEnrollment.objects.create(student=cls.student, course=cls.course, section="B")
 
         # 3. Setup Questions
-        self.q1 = Question.objects.create(course=self.course, text="Q1", marks=1, question_type=Question.Type.MCQ, created_by=self.teacher)
-        QuestionOption.objects.create(question=self.q1, text="A", is_correct=True)
-        QuestionOption.objects.create(question=self.q1, text="B", is_correct=False)
-
-        self.q2 = Question.objects.create(course=self.course, text="Q2", marks=2, question_type=Question.Type.MCQ, created_by=self.teacher)
-        QuestionOption.objects.create(question=self.q2, text="C", is_correct=False)
-        QuestionOption.objects.create(question=self.q2, text="D", is_correct=True)
+        cls.q1, cls.q2 = Question.objects.bulk_create([
+            Question(course=cls.course, text="Q1", marks=1, question_type=Question.Type.MCQ, created_by=cls.teacher),
+            Question(course=cls.course, text="Q2", marks=2, question_type=Question.Type.MCQ, created_by=cls.teacher),
+        ])
+        QuestionOption.objects.bulk_create([
+            QuestionOption(question=cls.q1, text="A", is_correct=True),
+            QuestionOption(question=cls.q1, text="B", is_correct=False),
+            QuestionOption(question=cls.q2, text="C", is_correct=False),
+            QuestionOption(question=cls.q2, text="D", is_correct=True),
+        ])
 
         # 4. Setup Exam
-        self.exam = Exam.objects.create(
+        cls.exam = Exam.objects.create(
             name="Final Exam",
-            course=self.course,
+            course=cls.course,
             duration_minutes=120,
             start_datetime=timezone.now(),
             end_datetime=timezone.now() + timedelta(hours=3),
             status=Exam.Status.RUNNING
         )
-        self.exam.questions.add(self.q1, self.q2)
+        cls.exam.questions.add(cls.q1, cls.q2)
+
+    def setUp(self):
+        # Cached exam lists outlive the per-test database rollback
+        cache.clear()
 
     def test_full_exam_flow(self):
         """Test the complete flow: Start -> Answer -> Submit -> Result"""
@@ -242,13 +386,232 @@ class ExamFlowTest(TestCase):
         
         # Expected Score: Q1 (1 mark) + Q2 (0 marks) = 1.0
         self.assertEqual(attempt.score_objective, 1.0)
-        print(f"\nTest Result: Student scored {attempt.score_objective}/{self.exam.questions.aggregate(total=models.Sum('marks'))['total'] or 3} correctly.")
+        self.exam.refresh_from_db()
+        self.assertEqual(self.exam.total_marks, 3)
+
+    def test_exam_total_marks_tracks_questions(self):
+        """Test that the denormalized total marks follow the exam's question set"""
+        self.exam.refresh_from_db()
+        self.assertEqual(self.exam.total_marks, 3)
+
+        self.exam.questions.remove(self.q2)
+        self.exam.refresh_from_db()
+        self.assertEqual(self.exam.total_marks, 1)
+
+        self.q1.marks = 4
+        self.q1.save()
+        self.exam.refresh_from_db()
+        self.assertEqual(self.exam.total_marks, 4)
+
+    def test_batch_autosave(self):
+        """Test saving several answers in one request, then overwriting one"""
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+        q1_correct = self.q1.options.get(is_correct=True).id
+        q2_wrong = self.q2.options.get(is_correct=False).id
+        q2_correct = self.q2.options.get(is_correct=True).id
+
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id,
+            'answers': [
+                {'question_id': self.q1.id, 'selected_options': [q1_correct]},
+                {'question_id': self.q2.id, 'selected_options': [q2_wrong]},
+            ]
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(StudentAnswer.objects.filter(exam_student_id=attempt_id).count(), 2)
+
+        # Re-saving updates the existing row instead of creating a new one
+        self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id,
+            'answers': [{'question_id': self.q2.id, 'selected_options': [q2_correct]}]
+        }, content_type='application/json')
+        self.assertEqual(StudentAnswer.objects.filter(exam_student_id=attempt_id).count(), 2)
+        saved_ans = StudentAnswer.objects.get(exam_student_id=attempt_id, question=self.q2)
+        self.assertEqual(saved_ans.selected_options, [q2_correct])
+
+    def test_batch_autosave_query_count_is_flat(self):
+        """Saving more answers in one batch should not add queries"""
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+        batch = [{'question_id': self.q1.id, 'selected_options': [self.q1.options.first().id]}]
+
+        self.assertQueryCountFlat(
+            lambda: self.client.post(reverse('save-answer'), {
+                'attempt_id': attempt_id, 'answers': batch
+            }, content_type='application/json'),
+            lambda: batch.append({'question_id': self.q2.id, 'selected_options': [self.q2.options.first().id]}),
+        )
+
+    def test_autosave_rejects_question_outside_exam(self):
+        """Answers for questions not on the exam are refused"""
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+        other = Question.objects.create(
+            course=self.course, text="Not on exam", marks=1,
+            question_type=Question.Type.MCQ, created_by=self.teacher
+        )
+
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': other.id, 'selected_options': []
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(StudentAnswer.objects.filter(exam_student_id=attempt_id).exists())
+
+    def test_autosave_accepts_string_question_ids(self):
+        """Question IDs sent as strings, from JSON or a form post, are still saved"""
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': str(self.q1.id), 'selected_options': []
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': self.q2.id, 'answer_text': 'form'
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(StudentAnswer.objects.filter(exam_student_id=attempt_id).count(), 2)
+
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': 'abc'
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_autosave_rejects_malformed_answers(self):
+        """Answers that are not objects are refused with a 400"""
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'answers': ['x']
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_autosave_rejects_string_selected_options(self):
+        """A string of option IDs is refused instead of being split into digits"""
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': self.q1.id, 'selected_options': '12'
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(StudentAnswer.objects.filter(exam_student_id=attempt_id).exists())
+
+    def test_autosave_with_question_linked_twice(self):
+        """A question attached to the exam twice can still be answered"""
+        ExamQuestion.objects.create(exam=self.exam, question=self.q1, order=3)
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+
+        response = self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': self.q1.id,
+            'selected_options': [self.q1.options.first().id]
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(StudentAnswer.objects.filter(exam_student_id=attempt_id, question=self.q1).exists())
+
+    def test_question_payload_refreshed_after_edit(self):
+        """Test that cached exam questions are invalidated when a question changes"""
+        self.client.login(username='student_flow', password='password')
+        self.client.post(reverse('start-exam', args=[self.exam.id]))
+
+        option = self.q1.options.get(is_correct=True)
+        option.text = "A (edited)"
+        with self.captureOnCommitCallbacks(execute=True):
+            option.save()
+
+        questions = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['questions']
+        q1_data = next(q for q in questions if q['id'] == self.q1.id)
+        self.assertIn("A (edited)", [opt['text'] for opt in q1_data['options']])
+
+    def test_active_exams_listing(self):
+        """Active exams API returns exam fields with the course name"""
+        self.client.login(username='student_flow', password='password')
+        response = self.client.get(reverse('active-exams'))
+        self.assertEqual(response.status_code, 200)
+        listed = {exam['id']: exam for exam in response.json()}
+        self.assertEqual(listed[self.exam.id]['name'], "Final Exam")
+        self.assertEqual(listed[self.exam.id]['course_name'], "Digital Electronics")
+        self.assertEqual(listed[self.exam.id]['duration_minutes'], 120)
+
+    def test_active_exams_cache_invalidated_on_exam_change(self):
+        """Editing an exam drops the cached active-exams list"""
+        self.client.login(username='student_flow', password='password')
+        self.client.get(reverse('active-exams'))
+
+        self.exam.name = "Final Exam (Rescheduled)"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.exam.save()
+        with self.assertNumQueries(3): # session, user, exams
+            response = self.client.get(reverse('active-exams'))
+        names = [exam['name'] for exam in response.json()]
+        self.assertIn("Final Exam (Rescheduled)", names)
+
+        # Served from the cache until the next change
+        with self.assertNumQueries(2):
+            self.client.get(reverse('active-exams'))
+
+    def test_student_dashboard_lists_enrolled_courses_only(self):
+        """Dashboard shows exams for the student's courses and not others"""
+        other_course = Course.objects.create(name="Other", code="OT101", department=self.dept, semester=1)
+        Exam.objects.create(
+            name="Other Exam", course=other_course, duration_minutes=30,
+            start_datetime=timezone.now(), end_datetime=timezone.now() + timedelta(hours=1),
+            status=Exam.Status.RUNNING
+        )
+        self.client.login(username='student_flow', password='password')
+        response = self.client.get(reverse('student_dashboard'))
+        self.assertContains(response, "Final Exam")
+        self.assertNotContains(response, "Other Exam")
+
+    def test_take_exam_page_queries(self):
+        """Exam page loads exam and course together (plus session, user and profile)"""
+        self.client.login(username='student_flow', password='password')
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('take_exam', args=[self.exam.id]))
+        self.assertContains(response, self.course.code)
+
+    def test_question_cache_invalidated_on_commit(self):
+        """Cached questions are dropped only once the edit is committed"""
+        key = exam_questions_key(self.exam.id)
+        cache.set(key, [])
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            option = self.q1.options.get(is_correct=False)
+            option.is_correct = True
+            option.save()
+            self.assertIsNotNone(cache.get(key))
+
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(key))
+
+    def test_grading_uses_current_answer_key(self):
+        """Changing the correct option is reflected in the next submission"""
+        self.client.login(username='student_flow', password='password')
+        attempt_id = self.client.post(reverse('start-exam', args=[self.exam.id])).json()['attempt_id']
+        wrong = self.q1.options.get(is_correct=False)
+        self.client.post(reverse('save-answer'), {
+            'attempt_id': attempt_id, 'question_id': self.q1.id, 'selected_options': [wrong.id]
+        }, content_type='application/json')
+
+        self.q1.options.update(is_correct=False)
+        wrong.is_correct = True
+        wrong.save()
+
+        response = self.client.post(reverse('submit-exam', args=[attempt_id]))
+        self.assertEqual(response.json()['score'], 1.0)
 
 class CSVImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(username='teacher_csv', email='teacher_csv@test.com', password='password', role=User.Role.TEACHER)
+        cls.dept = Department.objects.create(name="CSE", code="CSE")
+        cls.course = Course.objects.create(name="Python Basics", code="CS101", department=cls.dept, semester=1)
+
     def setUp(self):
-        self.teacher = User.objects.create_user(username='teacher_csv', email='teacher_csv@test.com', password='password', role=User.Role.TEACHER)
-        self.dept = Department.objects.create(name="CSE", code="CSE")
-        self.course = Course.objects.create(name="Python Basics", code="CS101", department=self.dept, semester=1)
         self.client.login(username='teacher_csv', password='password')
 
     def test_csv_import(self):
@@ -274,32 +637,52 @@ class CSVImportTests(TestCase):
         
         q1 = Question.objects.get(text="What is 5+5?")
         self.assertEqual(q1.marks, 2)
+        self.assertEqual(str(q1), "What is 5+5?")
         self.assertEqual(q1.options.count(), 2)
         self.assertTrue(q1.options.get(text="10").is_correct)
 
+    def test_csv_import_across_batches(self):
+        """Test that a file larger than one insert batch is imported completely"""
+        rows = "".join(f"Question {i}, M, 1, Yes, 1, No, 0\n" for i in range(501))
+        csv_file = io.BytesIO(("Question Text, Difficulty, Marks, Option 1, Is Correct, Option 2, Is Correct\n" + rows).encode('utf-8'))
+        csv_file.name = 'questions.csv'
 
-class Phase2RequirementsTests(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(username='teacher_p2', email='teacher_p2@test.com', password='password', role=User.Role.TEACHER)
-        self.student1 = User.objects.create_user(username='student_p2_1', email='s1@test.com', password='password', role=User.Role.STUDENT)
-        self.student2 = User.objects.create_user(username='student_p2_2', email='s2@test.com', password='password', role=User.Role.STUDENT)
+        response = self.client.post(reverse('import_questions'), {
+            'course': self.course.id,
+            'csv_file': csv_file
+        }, follow=True)
+
+        self.assertContains(response, "Successfully imported 501 questions")
+        self.assertEqual(Question.objects.count(), 501)
+        self.assertEqual(QuestionOption.objects.count(), 1002)
+        self.assertTrue(Question.objects.get(text="Question 500").options.get(text="Yes").is_correct)
+
+
+class Phase2RequirementsTests(QueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(username='teacher_p2', email='teacher_p2@test.com', password='password', role=User.Role.TEACHER)
+        cls.student1 = User.objects.create_user(username='student_p2_1', email='s1@test.com', password='password', role=User.Role.STUDENT)
+        cls.student2 = User.objects.create_user(username='student_p2_2', email='s2@test.com', password='password', role=User.Role.STUDENT)
         
-        self.dept = Department.objects.create(name="CSE", code="CSE")
-        self.course = Course.objects.create(name="Advanced Python", code="CS102", department=self.dept, semester=1)
+        cls.dept = Department.objects.create(name="CSE", code="CSE")
+        cls.course = Course.objects.create(name="Advanced Python", code="CS102", department=cls.dept, semester=1)
         
-        CourseEnrollment.objects.create(student=self.student1, course=self.course)
-        CourseEnrollment.objects.create(student=self.student2, course=self.course)
+        CourseEnrollment.objects.create(student=cls.student1, course=cls.course)
+        CourseEnrollment.objects.create(student=cls.student2, course=cls.course)
 
         # Create Questions
-        self.q1 = Question.objects.create(course=self.course, text="Q1", marks=1, question_type=Question.Type.MCQ, created_by=self.teacher)
-        QuestionOption.objects.create(question=self.q1, text="A", is_correct=True)
-        QuestionOption.objects.create(question=self.q1, text="B", is_correct=False)
-
-        self.q2 = Question.objects.create(course=self.course, text="Q2", marks=1, question_type=Question.Type.MCQ, created_by=self.teacher)
-        QuestionOption.objects.create(question=self.q2, text="C", is_correct=True)
-        QuestionOption.objects.create(question=self.q2, text="D", is_correct=False)
-        
-        self.q_short = Question.objects.create(course=self.course, text="Explain Python", marks=5, question_type=Question.Type.SHORT_ANSWER, created_by=self.teacher)
+        cls.q1, cls.q2, cls.q_short = Question.objects.bulk_create([
+            Question(course=cls.course, text="Q1", marks=1, question_type=Question.Type.MCQ, created_by=cls.teacher),
+            Question(course=cls.course, text="Q2", marks=1, question_type=Question.Type.MCQ, created_by=cls.teacher),
+            Question(course=cls.course, text="Explain Python", marks=5, question_type=Question.Type.SHORT_ANSWER, created_by=cls.teacher),
+        ])
+        QuestionOption.objects.bulk_create([
+            QuestionOption(question=cls.q1, text="A", is_correct=True),
+            QuestionOption(question=cls.q1, text="B", is_correct=False),
+            QuestionOption(question=cls.q2, text="C", is_correct=True),
+            QuestionOption(question=cls.q2, text="D", is_correct=False),
+        ])
 
     def test_randomization(self):
         """Test that questions are shuffled for different students if enabled"""
@@ -402,6 +785,13 @@ class Phase2RequirementsTests(TestCase):
         self.assertEqual(attempt.score_subjective, 4.0)
         self.assertEqual(attempt.total_score, 4.0)
 
+        # The evaluation page loads options for all questions at once
+        exam.questions.add(self.q1)
+        self.assertQueryCountFlat(
+            lambda: self.client.get(reverse('evaluate_attempt', args=[attempt_id])),
+            lambda: exam.questions.add(self.q2),
+        )
+
     def test_result_export(self):
         """Test exporting results to CSV"""
         exam = Exam.objects.create(
@@ -418,3 +808,41 @@ class Phase2RequirementsTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['Content-Type'], 'text/csv')
         self.assertContains(response, "85.5")
+
+
+class AdminChangelistQueryTests(QueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(username='admin_cl', email='admin_cl@test.com', password='password')
+        cls.dept = Department.objects.create(name="CSE", code="CSE")
+        cls.course = Course.objects.create(name="Python Basics", code="CS101", department=cls.dept, semester=1)
+        cls.exam = Exam.objects.create(
+            name="Admin Exam", course=cls.course, duration_minutes=60,
+            start_datetime=timezone.now(), end_datetime=timezone.now() + timedelta(hours=1)
+        )
+
+    def setUp(self):
+        self.client.login(username='admin_cl', password='password')
+
+    def _add_answers(self, n):
+        start = StudentAnswer.objects.count()
+        for i in range(start, start + n):
+            student = User.objects.create_user(username=f'cl_student_{i}', email=f'cl{i}@test.com', password='password')
+            attempt = ExamStudent.objects.create(exam=self.exam, student=student)
+            question = Question.objects.create(course=self.course, text=f"Q{i}")
+            StudentAnswer.objects.create(exam_student=attempt, question=question)
+
+    def test_student_answer_changelist_does_not_scale_with_rows(self):
+        """Changelist rendering should JOIN its FKs instead of fetching them per row"""
+        self._add_answers(1)
+        self.assertQueryCountFlat(
+            lambda: self.client.get(reverse('admin:exams_studentanswer_changelist')),
+            lambda: self._add_answers(5),
+        )
+
+    def test_question_changelist_truncates_text(self):
+        """Question changelist shows a 50 character preview of long questions"""
+        Question.objects.create(course=self.course, text="x" * 80)
+        response = self.client.get(reverse('admin:exams_question_changelist'))
+        self.assertContains(response, "x" * 50 + "...")
+        self.assertNotContains(response, "x" * 51)
@@ -5,16 +5,22 @@ from django.shortcuts import get_object_or_404, render, redirect
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.db import transaction, models
-from django.http import JsonResponse, HttpResponse
+from django.db.models import F
+from django.http import JsonResponse, HttpResponse, Http404, StreamingHttpResponse
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.db import transaction
-from django.db.models import Sum
 import csv
 import io
 import logging
+import orjson
 import random
-from .models import Exam, ExamStudent, Question, QuestionOption, StudentAnswer
-from .serializers import ExamSerializer, QuestionSerializer, StudentAnswerSerializer
+from collections import Counter, defaultdict
+from .models import Exam, ExamQuestion, ExamStudent, Question, QuestionOption, StudentAnswer
 from .forms import QuestionImportForm
+from .cache import (
+    ACTIVE_EXAMS_KEY, ACTIVE_EXAMS_TIMEOUT, EXAM_QUESTIONS_TIMEOUT, exam_questions_key
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,39 +33,50 @@ def is_teacher_or_admin(user):
 @user_passes_test(is_teacher_or_admin)
 def teacher_dashboard(request):
     # Show all exams for now. Later filter by created_by=request.user
-    exams = Exam.objects.all().order_by('-start_datetime')
-    return render(request, 'exams/teacher_dashboard.html', {'exams': exams})
+    exams = Exam.objects.select_related('course').only(
+        'id', 'name', 'start_datetime', 'status', 'course__code'
+    ).order_by('-start_datetime', '-id')
+    page_obj = Paginator(exams, 25).get_page(request.GET.get('page'))
+    return render(request, 'exams/teacher_dashboard.html', {'page_obj': page_obj})
 
 @login_required
 @user_passes_test(is_teacher_or_admin)
 def exam_live_status(request, exam_id):
-    exam = get_object_or_404(Exam, id=exam_id)
-    attempts = ExamStudent.objects.filter(exam=exam).select_related('student', 'student__student_profile')
+    exam = get_object_or_404(Exam.objects.select_related('course'), id=exam_id)
+    attempts = ExamStudent.objects.filter(exam=exam).select_related(
+        'student', 'student__student_profile'
+    ).only(
+        'id', 'status', 'score_objective', 'total_score', 'started_at', 'submitted_at',
+        'student__first_name', 'student__last_name', 'student__username',
+        'student__student_profile__roll_no'
+    ).order_by('-total_score')
+    # The page lists every attempt anyway, so tally the status counters from
+    # the same rows instead of a separate query
+    attempts_list = list(attempts)
+    status_counts = Counter(attempt.status for attempt in attempts_list)
     
     context = {
         'exam': exam,
-        'attempts': attempts,
-        'total_students': attempts.count(),
-        'in_progress_count': attempts.filter(status=ExamStudent.Status.IN_PROGRESS).count(),
-        'submitted_count': attempts.filter(status__in=[ExamStudent.Status.SUBMITTED, ExamStudent.Status.AUTO_SUBMITTED]).count(),
-        'not_started_count': attempts.filter(status=ExamStudent.Status.NOT_STARTED).count(),
+        'attempts': attempts_list,
+        'total_students': len(attempts_list),
+        'in_progress_count': status_counts[ExamStudent.Status.IN_PROGRESS],
+        'submitted_count': status_counts[ExamStudent.Status.SUBMITTED] + status_counts[ExamStudent.Status.AUTO_SUBMITTED],
+        'not_started_count': status_counts[ExamStudent.Status.NOT_STARTED],
     }
     return render(request, 'exams/exam_live_status.html', context)
 
 @login_required
 @user_passes_test(is_teacher_or_admin)
 def evaluate_attempt(request, attempt_id):
-    attempt = get_object_or_404(ExamStudent, id=attempt_id)
+    # The header shows the student's name and the exam
+    attempt = get_object_or_404(ExamStudent.objects.select_related('student', 'exam'), id=attempt_id)
     
-    # Get all questions for this exam
+    # Get all questions for this exam, with every option loaded in one extra query
     # We need to join with StudentAnswer to get the answer if it exists
-    questions = attempt.exam.questions.all()
+    questions = attempt.exam.questions.prefetch_related('options')
     
-    # Calculate total possible marks (sum of all question marks)
-    total_marks = questions.aggregate(total=Sum('marks'))['total'] or 0
-    
-    # Fetch answers
-    answers = StudentAnswer.objects.filter(exam_student=attempt).select_related('question')
+    # Fetch answers (questions come from the list above, so no join needed)
+    answers = StudentAnswer.objects.filter(exam_student=attempt)
     answers_map = {ans.question_id: ans for ans in answers}
     
     evaluation_data = []
@@ -74,10 +91,24 @@ def evaluate_attempt(request, attempt_id):
     context = {
         'attempt': attempt,
         'evaluation_data': evaluation_data,
-        'total_marks': total_marks
+        'total_marks': attempt.exam.total_marks
     }
     return render(request, 'exams/evaluate_attempt.html', context)
 
+IMPORT_BATCH_SIZE = 500
+DIFFICULTY_MAP = {'E': 'E', 'M': 'M', 'H': 'H', 'EASY': 'E', 'MEDIUM': 'M', 'HARD': 'H'}
+TRUTHY_VALUES = frozenset(['true', '1', 'yes', 't', 'correct'])
+
+def save_question_batch(questions, parsed_options):
+    # bulk_create sets primary keys on the returned instances (Postgres)
+    Question.objects.bulk_create(questions)
+    QuestionOption.objects.bulk_create([
+        QuestionOption(question=question, text=opt_text, is_correct=is_correct)
+        for question, options in zip(questions, parsed_options)
+        for opt_text, is_correct in options
+    ], batch_size=1000)
+    return len(questions)
+
 @login_required
 @user_passes_test(is_teacher_or_admin)
 def import_questions(request):
@@ -92,13 +123,17 @@ def import_questions(request):
                 return render(request, 'exams/import_questions.html', {'form': form})
 
             try:
-                decoded_file = csv_file.read().decode('utf-8-sig') # utf-8-sig handles BOM from Excel
-                io_string = io.StringIO(decoded_file)
-                reader = csv.reader(io_string)
+                # Decode while reading rather than loading the whole upload into memory
+                text_file = io.TextIOWrapper(csv_file.file, encoding='utf-8-sig', newline='') # utf-8-sig handles BOM from Excel
+                reader = csv.reader(text_file)
                 
                 # Skip header
                 next(reader, None)
                 
+                # Buffer rows so the inserts can be batched; flushed every
+                # IMPORT_BATCH_SIZE rows so memory stays flat for large files
+                questions = []
+                parsed_options = []
                 questions_created = 0
                 
                 with transaction.atomic():
@@ -110,42 +145,43 @@ def import_questions(request):
                         if not text:
                             continue
 
-                        difficulty_raw = row[1].strip().upper()
-                        difficulty_map = {'E': 'E', 'M': 'M', 'H': 'H', 'EASY': 'E', 'MEDIUM': 'M', 'HARD': 'H'}
-                        difficulty = difficulty_map.get(difficulty_raw, 'M')
+                        difficulty = DIFFICULTY_MAP.get(row[1].strip().upper(), 'M')
                         
                         try:
                             marks = int(row[2].strip())
                         except ValueError:
                             marks = 1
                             
-                        question = Question.objects.create(
+                        # bulk_create skips save(), so fill the preview here
+                        questions.append(Question(
                             course=course,
                             text=text,
+                            text_preview=Question.make_preview(text),
                             difficulty=difficulty,
                             marks=marks,
                             question_type=Question.Type.MCQ,
                             created_by=request.user
-                        )
+                        ))
                         
                         # Options start from index 3
                         # Format: Option1, IsCorrect1, Option2, IsCorrect2...
+                        options = []
                         for i in range(3, len(row), 2):
                             if i + 1 < len(row):
                                 opt_text = row[i].strip()
                                 if not opt_text:
                                     continue
                                     
-                                is_correct_raw = row[i+1].strip().lower()
-                                is_correct = is_correct_raw in ['true', '1', 'yes', 't', 'correct']
+                                is_correct = row[i+1].strip().lower() in TRUTHY_VALUES
                                 
-                                QuestionOption.objects.create(
-                                    question=question,
-                                    text=opt_text,
-                                    is_correct=is_correct
-                                )
-                        
-                        questions_created += 1
+                                options.append((opt_text, is_correct))
+                        parsed_options.append(options)
+
+                        if len(questions) >= IMPORT_BATCH_SIZE:
+                            questions_created += save_question_batch(questions, parsed_options)
+                            questions, parsed_options = [], []
+
+                    questions_created += save_question_batch(questions, parsed_options)
                         
                 messages.success(request, f'Successfully imported {questions_created} questions.')
                 return redirect('teacher_dashboard')
@@ -162,19 +198,19 @@ def import_questions(request):
 
 @login_required
 def student_dashboard(request):
-    # Get exams that are SCHEDULED or RUNNING
-    # In production, filter by CourseEnrollment
+    # Get exams that are SCHEDULED or RUNNING in the student's enrolled courses
     now = timezone.now()
     active_exams = Exam.objects.filter(
         status__in=[Exam.Status.SCHEDULED, Exam.Status.RUNNING],
-        end_datetime__gt=now
-    ).order_by('start_datetime')
+        end_datetime__gt=now,
+        course__enrollments__student=request.user
+    ).select_related('course').order_by('start_datetime')
     
-    # Get past attempts
+    # Get past attempts (the template shows exam name and total marks per row)
     past_attempts = ExamStudent.objects.filter(
         student=request.user,
         status__in=[ExamStudent.Status.SUBMITTED, ExamStudent.Status.AUTO_SUBMITTED]
-    ).order_by('-submitted_at')
+    ).select_related('exam').order_by('-submitted_at')
 
     return render(request, 'exams/student_dashboard.html', {
         'active_exams': active_exams,
@@ -183,7 +219,11 @@ def student_dashboard(request):
 
 @login_required
 def take_exam_view(request, exam_id):
-    exam = get_object_or_404(Exam, id=exam_id)
+    # The page only renders exam/course details; questions are loaded via StartExamView
+    exam = get_object_or_404(
+        Exam.objects.select_related('course').only('id', 'name', 'start_datetime', 'end_datetime', 'course__code'),
+        id=exam_id
+    )
     # Basic validation: is it too early? is it too late?
     now = timezone.now()
     if now < exam.start_datetime:
@@ -195,6 +235,36 @@ def take_exam_view(request, exam_id):
 
 # --- API Views (Student Exam Interface) ---
 
+def orjson_response(data, status=200):
+    # Used on the hottest student endpoints instead of DRF's JSON renderer.
+    # Saved answers are keyed by question ID, hence OPT_NON_STR_KEYS.
+    return HttpResponse(
+        orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        content_type='application/json',
+        status=status
+    )
+
+def exam_questions_payload(exam):
+    # Two queries regardless of exam size: questions, then all of their options
+    questions = list(exam.questions.values('id', 'text', 'question_type', 'marks'))
+    options_by_question = defaultdict(list)
+    for option in QuestionOption.objects.filter(
+        question_id__in=[q['id'] for q in questions]
+    ).order_by('id').values('id', 'question_id', 'text'): # Don't expose is_correct to students!
+        options_by_question[option.pop('question_id')].append(option)
+    for question in questions:
+        question['options'] = options_by_question[question['id']]
+    return questions
+
+def exam_correct_options(exam_id):
+    # {question_id: frozenset(correct option IDs)} for every question in the exam
+    correct_options_map = defaultdict(set)
+    for question_id, option_id in QuestionOption.objects.filter(
+        question__exam=exam_id, is_correct=True
+    ).values_list('question_id', 'id'):
+        correct_options_map[question_id].add(option_id)
+    return {question_id: frozenset(option_ids) for question_id, option_ids in correct_options_map.items()}
+
 class ActiveExamsView(views.APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -204,38 +274,58 @@ class ActiveExamsView(views.APIView):
         # For MVP, let's just return all RUNNING or SCHEDULED exams for courses the student is enrolled in
         # This requires looking up CourseEnrollment, which we'll add later.
         # For now, return all active exams.
-        exams = Exam.objects.filter(
-            status__in=[Exam.Status.SCHEDULED, Exam.Status.RUNNING],
-            end_datetime__gt=now
+        # Plain dicts straight from the query; no serializer needed for a read-only listing.
+        # The list is the same for every student, so it is shared through the cache
+        exams = cache.get_or_set(
+            ACTIVE_EXAMS_KEY,
+            lambda: list(Exam.objects.filter(
+                status__in=[Exam.Status.SCHEDULED, Exam.Status.RUNNING],
+                end_datetime__gt=now
+            ).values(
+                'id', 'name', 'duration_minutes', 'start_datetime', 'end_datetime', 'allow_back_navigation',
+                course_name=F('course__name')
+            )),
+            ACTIVE_EXAMS_TIMEOUT
         )
-        serializer = ExamSerializer(exams, many=True)
-        return Response(serializer.data)
+        # Drop exams that ended since the list was cached
+        return Response([exam for exam in exams if exam['end_datetime'] > now])
 
 class StartExamView(views.APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, exam_id):
-        exam = get_object_or_404(Exam, id=exam_id)
+        exam = get_object_or_404(Exam.objects.only('id', 'name', 'duration_minutes', 'shuffle_questions'), id=exam_id)
         student = request.user
         
-        # Check if already started
-        attempt, created = ExamStudent.objects.get_or_create(
-            exam=exam,
-            student=student
-        )
+        # Check if already started (resuming is the common case: one SELECT)
+        attempt = ExamStudent.objects.filter(exam=exam, student=student).first()
         
-        # Fetch all questions once for reuse
-        all_questions = {q.id: q for q in exam.questions.all()}
+        # Serialized questions are identical for every student, so share them
+        # through the cache and only apply the per-student order below
+        questions_data = cache.get_or_set(
+            exam_questions_key(exam.id),
+            lambda: exam_questions_payload(exam),
+            EXAM_QUESTIONS_TIMEOUT
+        )
+        all_questions = {q['id']: q for q in questions_data}
         
-        if created:
-            attempt.status = ExamStudent.Status.IN_PROGRESS
-            attempt.started_at = timezone.now()
+        if attempt is None:
             # Generate and store shuffled question order
             question_ids = list(all_questions.keys())
             if exam.shuffle_questions:
                 random.shuffle(question_ids)
-            attempt.question_order = question_ids
-            attempt.save()
+            # INSERT ... ON CONFLICT DO NOTHING: if a concurrent request created
+            # the attempt first, we pick up theirs below instead of failing
+            ExamStudent.objects.bulk_create([
+                ExamStudent(
+                    exam=exam,
+                    student=student,
+                    status=ExamStudent.Status.IN_PROGRESS,
+                    started_at=timezone.now(),
+                    question_order=question_ids
+                )
+            ], ignore_conflicts=True)
+            attempt = ExamStudent.objects.get(exam=exam, student=student)
             
         # Retrieve questions in stored order
         if attempt.question_order:
@@ -251,15 +341,15 @@ class StartExamView(views.APIView):
         else:
             # Fallback for existing attempts without stored order
             questions = list(all_questions.values())
-            
-        serializer = QuestionSerializer(questions, many=True)
         
         # Fetch existing answers if resuming
-        existing_answers = StudentAnswer.objects.filter(exam_student=attempt)
+        existing_answers = StudentAnswer.objects.filter(exam_student=attempt).values(
+            'question_id', 'selected_options', 'answer_text'
+        )
         answers_map = {
-            ans.question.id: {
-                'selected_options': ans.selected_options,
-                'answer_text': ans.answer_text
+            ans['question_id']: {
+                'selected_options': ans['selected_options'],
+                'answer_text': ans['answer_text']
             } for ans in existing_answers
         }
 
@@ -269,10 +359,10 @@ class StartExamView(views.APIView):
         total_seconds = exam.duration_minutes * 60
         remaining_seconds = max(0, total_seconds - elapsed)
 
-        return Response({
+        return orjson_response({
             "attempt_id": attempt.id,
             "exam_name": exam.name,
-            "questions": serializer.data,
+            "questions": questions,
             "saved_answers": answers_map,
             "remaining_seconds": remaining_seconds
         })
@@ -282,72 +372,138 @@ class SubmitAnswerView(views.APIView):
 
     def post(self, request):
         # Expects: { "attempt_id": 1, "question_id": 5, "selected_options": [1, 2], "answer_text": "..." }
+        # or a batch: { "attempt_id": 1, "answers": [{ "question_id": 5, "selected_options": [1, 2], "answer_text": "..." }, ...] }
         data = request.data
-        attempt = get_object_or_404(ExamStudent, id=data.get('attempt_id'), student=request.user)
+        # Autosave only needs the attempt's status and exam; skip the rest of the row
+        attempt = get_object_or_404(
+            ExamStudent.objects.only('id', 'status', 'exam_id'),
+            id=data.get('attempt_id'), student=request.user
+        )
         
         if attempt.status != ExamStudent.Status.IN_PROGRESS:
             return Response({"error": "Exam is not in progress"}, status=status.HTTP_400_BAD_REQUEST)
 
-        question_id = data.get('question_id')
-        question = get_object_or_404(Question, id=question_id)
+        # Reject malformed payloads up front rather than failing halfway through the batch
+        answers_payload = data.get('answers', [data])
+        if not isinstance(answers_payload, list) or not all(isinstance(item, dict) for item in answers_payload):
+            return Response({"error": "answers must be a list of answer objects"}, status=status.HTTP_400_BAD_REQUEST)
+        if not all(isinstance(item.get('selected_options', []), list) for item in answers_payload):
+            return Response({"error": "selected_options must be a list of option IDs"}, status=status.HTTP_400_BAD_REQUEST)
 
-        answer, created = StudentAnswer.objects.update_or_create(
-            exam_student=attempt,
-            question=question,
-            defaults={
-                'selected_options': data.get('selected_options', []),
-                'answer_text': data.get('answer_text', '')
-            }
+        # A single answer is saved as a batch of one. Keyed by question so the
+        # latest entry wins if the client sends the same question twice. IDs may arrive
+        # as strings (form posts, loose JSON), so normalise them before comparing.
+        try:
+            answers_data = {int(item.get('question_id')): item for item in answers_payload}
+        except (TypeError, ValueError):
+            return Response({"error": "question_id must be a question ID"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Only questions that belong to this attempt's exam may be answered. Compared as
+        # distinct IDs because nothing stops a question being linked to an exam twice
+        exam_question_ids = set(ExamQuestion.objects.filter(
+            exam_id=attempt.exam_id, question_id__in=answers_data.keys()
+        ).values_list('question_id', flat=True))
+        if not exam_question_ids >= answers_data.keys():
+            raise Http404("Question not found")
+
+        try:
+            answers = [
+                StudentAnswer(
+                    exam_student=attempt,
+                    question_id=question_id,
+                    selected_options=[int(opt) for opt in item.get('selected_options', [])],
+                    answer_text=item.get('answer_text', '')
+                ) for question_id, item in answers_data.items()
+            ]
+        except (TypeError, ValueError):
+            return Response({"error": "selected_options must be a list of option IDs"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # One INSERT ... ON CONFLICT DO UPDATE for the whole batch
+        StudentAnswer.objects.bulk_create(
+            answers,
+            update_conflicts=True,
+            unique_fields=['exam_student', 'question'],
+            update_fields=['selected_options', 'answer_text'],
+            batch_size=200
         )
         
-        return Response({"status": "saved"})
+        return orjson_response({"status": "saved"})
+
+# Grades objective answers and returns the objective score. Takes no request
+# state, so it can be handed to a background worker as-is.
+def auto_evaluate_attempt(attempt):
+    total_objective_score = 0.0
+    
+    negative_marking = attempt.exam.negative_marking
+    
+    # Read the answer key fresh (one indexed query) so grading never uses a stale copy
+    correct_options_map = exam_correct_options(attempt.exam_id)
+    
+    # Fetch the objective answers for this attempt, with just the columns grading reads
+    student_answers = StudentAnswer.objects.filter(
+        exam_student=attempt,
+        question__question_type__in=[Question.Type.MCQ, Question.Type.MSQ, Question.Type.TRUE_FALSE]
+    ).select_related('question').only(
+        'id', 'selected_options', 'question__id', 'question__marks'
+    )
+    evaluated_answers = []
+    
+    for ans in student_answers:
+        question = ans.question
+        correct_options = correct_options_map.get(question.id, frozenset())
+        selected_options = frozenset(ans.selected_options) # Assuming list of IDs
+        
+        # Basic Logic: Full match required for marks (can be improved for partial marking)
+        if correct_options == selected_options:
+            ans.marks_awarded = question.marks
+            ans.is_evaluated = True
+            total_objective_score += question.marks
+        else:
+            ans.marks_awarded = 0
+            ans.is_evaluated = True
+            # Negative marking check
+            if negative_marking > 0 and len(selected_options) > 0:
+                 total_objective_score -= negative_marking
+
+        evaluated_answers.append(ans)
+
+    StudentAnswer.objects.bulk_update(evaluated_answers, ['marks_awarded', 'is_evaluated'], batch_size=500)
+    return total_objective_score
 
 class SubmitExamView(views.APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, attempt_id):
-        attempt = get_object_or_404(ExamStudent, id=attempt_id, student=request.user)
-        
-        # Prevent re-submission if already submitted
-        if attempt.status in [ExamStudent.Status.SUBMITTED, ExamStudent.Status.AUTO_SUBMITTED]:
-             return Response({"status": "already_submitted"})
-
-        attempt.status = ExamStudent.Status.SUBMITTED
-        attempt.submitted_at = timezone.now()
-        
-        # --- Auto Evaluation Logic ---
-        total_objective_score = 0.0
-        
-        # Fetch all answers for this attempt
-        student_answers = StudentAnswer.objects.filter(exam_student=attempt).select_related('question')
-        
-        for ans in student_answers:
-            question = ans.question
-            if question.question_type in [Question.Type.MCQ, Question.Type.MSQ, Question.Type.TRUE_FALSE]:
-                # Get correct option IDs
-                correct_options = set(question.options.filter(is_correct=True).values_list('id', flat=True))
-                selected_options = set(ans.selected_options) # Assuming list of IDs
-                
-                # Basic Logic: Full match required for marks (can be improved for partial marking)
-                if correct_options == selected_options:
-                    ans.marks_awarded = question.marks
-                    ans.is_evaluated = True
-                    total_objective_score += question.marks
-                else:
-                    ans.marks_awarded = 0
-                    ans.is_evaluated = True
-                    # Negative marking check
-                    if attempt.exam.negative_marking > 0 and len(selected_options) > 0:
-                         total_objective_score -= attempt.exam.negative_marking
-
-                ans.save()
-
-        # Allow negative total score if negative marking is enabled? 
-        # Usually total score shouldn't be negative, but for individual sections it might be.
-        # Let's keep it raw for now as per test requirement (which expects -0.5)
-        attempt.score_objective = total_objective_score 
-        attempt.total_score = attempt.score_objective + attempt.score_subjective
-        attempt.save()
+        finished = [ExamStudent.Status.SUBMITTED, ExamStudent.Status.AUTO_SUBMITTED]
+
+        # Claim, grading and score save commit together: if grading fails the claim
+        # rolls back and the attempt stays open for a retry
+        with transaction.atomic():
+            # Claim the attempt with a conditional UPDATE so concurrent submits can't both grade it
+            updated = ExamStudent.objects.filter(
+                id=attempt_id, student=request.user
+            ).exclude(status__in=finished).update(
+                status=ExamStudent.Status.SUBMITTED, submitted_at=timezone.now()
+            )
+            # Grading only reads the subjective score and the exam's negative marking
+            attempt = get_object_or_404(
+                ExamStudent.objects.select_related('exam').only('id', 'exam_id', 'score_subjective', 'exam__negative_marking'),
+                id=attempt_id, student=request.user
+            )
+
+            # Prevent re-submission if already submitted
+            if not updated:
+                return Response({"status": "already_submitted"})
+
+            # --- Auto Evaluation Logic ---
+            total_objective_score = auto_evaluate_attempt(attempt)
+
+            # Allow negative total score if negative marking is enabled? 
+            # Usually total score shouldn't be negative, but for individual sections it might be.
+            # Let's keep it raw for now as per test requirement (which expects -0.5)
+            attempt.score_objective = total_objective_score 
+            attempt.total_score = attempt.score_objective + attempt.score_subjective
+            attempt.save(update_fields=['score_objective', 'total_score'])
         
         return Response({"status": "submitted", "score": attempt.total_score})
 
@@ -356,7 +512,7 @@ class SubmitExamView(views.APIView):
 @user_passes_test(is_teacher_or_admin)
 def grade_attempt(request, attempt_id):
     if request.method == 'POST':
-        attempt = get_object_or_404(ExamStudent, id=attempt_id)
+        attempt = get_object_or_404(ExamStudent.objects.only('id', 'score_objective'), id=attempt_id)
         question_id = request.POST.get('question_id')
         try:
             marks = float(request.POST.get('marks', 0))
@@ -384,38 +540,49 @@ def grade_attempt(request, attempt_id):
             question__question_type__in=[Question.Type.SHORT_ANSWER, Question.Type.LONG_ANSWER, Question.Type.CODE]
         ).aggregate(total=models.Sum('marks_awarded'))['total'] or 0.0
         
-        attempt.score_subjective = subjective_score
-        attempt.total_score = attempt.score_objective + attempt.score_subjective
-        attempt.save()
+        # Single UPDATE; total is derived from the stored objective score, not our copy of it
+        ExamStudent.objects.filter(pk=attempt.pk).update(
+            score_subjective=subjective_score,
+            total_score=F('score_objective') + subjective_score
+        )
         
-        return JsonResponse({'status': 'success', 'new_total': attempt.total_score})
+        return JsonResponse({'status': 'success', 'new_total': attempt.score_objective + subjective_score})
     return JsonResponse({'status': 'error'}, status=400)
 
+class Echo:
+    # File-like object for csv.writer that hands each line back instead of buffering it
+    def write(self, value):
+        return value
+
 @login_required
 @user_passes_test(is_teacher_or_admin)
 def export_results(request, exam_id):
-    exam = get_object_or_404(Exam, id=exam_id)
-    attempts = ExamStudent.objects.filter(exam=exam).select_related('student', 'student__student_profile')
-    
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="{exam.name}_results.csv"'
+    exam = get_object_or_404(Exam.objects.only('id', 'name'), id=exam_id)
+    attempts = ExamStudent.objects.filter(exam=exam).select_related('student', 'student__student_profile').only(
+        'status', 'score_objective', 'score_subjective', 'total_score', 'submitted_at',
+        'student__first_name', 'student__last_name', 'student__username', 'student__email',
+        'student__student_profile__roll_no'
+    )
     
-    writer = csv.writer(response)
-    writer.writerow(['Roll No', 'Name', 'Email', 'Status', 'Objective Score', 'Subjective Score', 'Total Score', 'Submitted At'])
+    def rows():
+        yield ['Roll No', 'Name', 'Email', 'Status', 'Objective Score', 'Subjective Score', 'Total Score', 'Submitted At']
+        # Stream rows out as they are read instead of building the whole file in memory
+        for attempt in attempts.iterator(chunk_size=500):
+            student_name = f"{attempt.student.first_name} {attempt.student.last_name}".strip() or attempt.student.username
+            roll_no = attempt.student.student_profile.roll_no if hasattr(attempt.student, 'student_profile') else 'N/A'
+            
+            yield [
+                roll_no,
+                student_name,
+                attempt.student.email,
+                attempt.get_status_display(),
+                attempt.score_objective,
+                attempt.score_subjective,
+                attempt.total_score,
+                attempt.submitted_at
+            ]
     
-    for attempt in attempts:
-        student_name = f"{attempt.student.first_name} {attempt.student.last_name}".strip() or attempt.student.username
-        roll_no = attempt.student.student_profile.roll_no if hasattr(attempt.student, 'student_profile') else 'N/A'
-        
-        writer.writerow([
-            roll_no,
-            student_name,
-            attempt.student.email,
-            attempt.get_status_display(),
-            attempt.score_objective,
-            attempt.score_subjective,
-            attempt.total_score,
-            attempt.submitted_at
-        ])
-        
+    writer = csv.writer(Echo())
+    response = StreamingHttpResponse((writer.writerow(row) for row in rows()), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{exam.name}_results.csv"'
     return response